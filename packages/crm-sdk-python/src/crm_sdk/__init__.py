@@ -11,6 +11,7 @@ Example:
 """
 
 from .client import CRMClient
+from .async_client import AsyncCRMClient
 from .models import (
     User,
     Tenant,
@@ -23,6 +24,7 @@ from .models import (
     PipelineStage,
     PaginatedResponse,
     AuthTokens,
+    validate_list,
 )
 from .exceptions import (
     CRMError,
@@ -37,6 +39,7 @@ __version__ = "1.0.0"
 __all__ = [
     # Client
     "CRMClient",
+    "AsyncCRMClient",
     # Models
     "User",
     "Tenant",
@@ -49,6 +52,7 @@ __all__ = [
     "PipelineStage",
     "PaginatedResponse",
     "AuthTokens",
+    "validate_list",
     # Exceptions
     "CRMError",
     "AuthenticationError",
@@ -0,0 +1,816 @@
+"""
+CRM Platform Python SDK Async Client.
+
+Asynchronous client for the CRM Platform API, built on ``httpx.AsyncClient``.
+Independent requests can be issued concurrently with ``asyncio.gather``.
+"""
+
+from functools import cached_property
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Type
+import asyncio
+import httpx
+
+from .client import (
+    BATCH_FALLBACK_WORKERS,
+    BATCH_SIZE,
+    DEFAULT_LIMITS,
+    MAX_PER_PAGE,
+    M,
+    _HTTP2_AVAILABLE,
+    _BaseClient,
+    _batch_unsupported,
+    _chunks,
+    _json_dumps,
+    _json_loads,
+    _model_json,
+    _paginated,
+    _parse_items,
+)
+from .models import (
+    AuthTokens,
+    LoginResponse,
+    User,
+    UserCreate,
+    UserUpdate,
+    Tenant,
+    TenantCreate,
+    Customer,
+    CustomerCreate,
+    CustomerUpdate,
+    Contact,
+    ContactCreate,
+    Lead,
+    LeadCreate,
+    LeadUpdate,
+    Opportunity,
+    OpportunityCreate,
+    Deal,
+    Pipeline,
+    PaginatedResponse,
+)
+from .exceptions import (
+    CRMError,
+    AuthenticationError,
+    NetworkError,
+    NotFoundError,
+    TimeoutError as SDKTimeoutError,
+)
+
+
+class AsyncCRMClient(_BaseClient):
+    """
+    Asynchronous client for CRM Platform API.
+
+    Example:
+        >>> async with AsyncCRMClient(base_url="https://api.crmplatform.my") as client:
+        ...     await client.auth.login("user@example.com", "password")
+        ...     customers = await client.customers.get_many(["id-1", "id-2"])
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://api.crmplatform.my",
+        api_key: Optional[str] = None,
+        access_token: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        timeout: float = 30.0,
+        auto_refresh: bool = True,
+        retries: int = 3,
+        backoff_base: float = 0.25,
+        http2: bool = _HTTP2_AVAILABLE,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+    ):
+        """
+        Initialize the async CRM client.
+
+        Args:
+            base_url: Base URL of the CRM API.
+            api_key: API key for authentication (alternative to login).
+            access_token: Pre-existing access token.
+            tenant_id: Tenant ID for multi-tenant requests.
+            timeout: Request timeout in seconds.
+            auto_refresh: Automatically refresh expired tokens.
+            retries: Times to retry rate-limited (429) and unavailable
+                (503/504) responses; 0 disables retries.
+            backoff_base: Base delay in seconds for exponential backoff.
+            http2: Use HTTP/2 (enabled by default when ``h2`` is installed).
+            limits: Connection pool limits for the underlying HTTP client.
+        """
+        super().__init__(
+            base_url=base_url,
+            api_key=api_key,
+            access_token=access_token,
+            tenant_id=tenant_id,
+            timeout=timeout,
+            auto_refresh=auto_refresh,
+            retries=retries,
+            backoff_base=backoff_base,
+        )
+
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            http2=http2,
+            limits=limits,
+            headers=self._get_default_headers(),
+        )
+        self._refresh_lock: Optional[asyncio.Lock] = None
+
+    # Services are created on first access, so short-lived clients only pay
+    # for the ones they use.
+    @cached_property
+    def auth(self) -> "AsyncAuthService":
+        """Authentication service."""
+        return AsyncAuthService(self)
+
+    @cached_property
+    def users(self) -> "AsyncUserService":
+        """User management service."""
+        return AsyncUserService(self)
+
+    @cached_property
+    def tenants(self) -> "AsyncTenantService":
+        """Tenant management service."""
+        return AsyncTenantService(self)
+
+    @cached_property
+    def customers(self) -> "AsyncCustomerService":
+        """Customer management service."""
+        return AsyncCustomerService(self)
+
+    @cached_property
+    def contacts(self) -> "AsyncContactService":
+        """Contact management service."""
+        return AsyncContactService(self)
+
+    @cached_property
+    def leads(self) -> "AsyncLeadService":
+        """Lead management service."""
+        return AsyncLeadService(self)
+
+    @cached_property
+    def opportunities(self) -> "AsyncOpportunityService":
+        """Opportunity management service."""
+        return AsyncOpportunityService(self)
+
+    @cached_property
+    def deals(self) -> "AsyncDealService":
+        """Deal management service."""
+        return AsyncDealService(self)
+
+    @cached_property
+    def pipelines(self) -> "AsyncPipelineService":
+        """Pipeline management service."""
+        return AsyncPipelineService(self)
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncCRMClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def _refresh_access_token(self, only_if_due: bool = False) -> None:
+        """
+        Refresh the access token.
+
+        Concurrent callers are serialized so only one refresh request is in
+        flight. With ``only_if_due``, callers that waited for another task's
+        refresh skip their own once the new token is in place.
+        """
+        # Created lazily so the lock binds to the running event loop.
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+
+        async with self._refresh_lock:
+            if only_if_due and not self._should_refresh_token():
+                return
+
+            if not self._refresh_token:
+                raise AuthenticationError("No refresh token available")
+
+            response = await self._client.post(
+                "/api/v1/auth/refresh",
+                content=_json_dumps({"refresh_token": self._refresh_token}),
+            )
+            self._handle_refresh_response(response)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Make an HTTP request to the API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.).
+            path: API endpoint path.
+            params: Query parameters.
+            json: JSON body data.
+            content: Pre-encoded JSON body, used when json is not given.
+            **kwargs: Additional arguments passed to httpx.
+
+        Returns:
+            httpx.Response object.
+
+        Raises:
+            CRMError: On API errors.
+            NetworkError: On network issues.
+            TimeoutError: On request timeout.
+        """
+        if self._should_refresh_token():
+            await self._refresh_access_token(only_if_due=True)
+
+        if json is not None:
+            content = _json_dumps(json)
+
+        deadline = self._retry_deadline()
+        attempt = 0
+
+        while True:
+            try:
+                response = await self._client.request(
+                    method=method,
+                    url=path,
+                    params=params,
+                    content=content,
+                    headers=self._get_headers(),
+                    **kwargs,
+                )
+            except httpx.TimeoutException as e:
+                raise SDKTimeoutError(f"Request timed out: {e}", timeout=self.timeout)
+            except httpx.RequestError as e:
+                raise NetworkError(f"Network error: {e}", original_error=e)
+
+            delay = self._retry_delay(method, response, attempt, deadline)
+            if delay is None:
+                return self._handle_response(response)
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        """Make a GET request."""
+        response = await self.request("GET", path, params=params, **kwargs)
+        return _json_loads(response.content)
+
+    async def post(self, path: str, json: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        """Make a POST request."""
+        response = await self.request("POST", path, json=json, **kwargs)
+        return _json_loads(response.content)
+
+    async def put(self, path: str, json: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        """Make a PUT request."""
+        response = await self.request("PUT", path, json=json, **kwargs)
+        return _json_loads(response.content)
+
+    async def delete(self, path: str, **kwargs: Any) -> None:
+        """Make a DELETE request."""
+        await self.request("DELETE", path, **kwargs)
+
+    async def _request_model(self, model: Type[M], method: str, path: str, **kwargs: Any) -> M:
+        """Make a request and validate the JSON response body directly as ``model``."""
+        response = await self.request(method, path, **kwargs)
+        return model.model_validate_json(response.content)
+
+    async def _request_items(
+        self, model: Type[M], method: str, path: str, **kwargs: Any
+    ) -> List[M]:
+        """Make a request and validate the ``data`` list of the response body as ``model``."""
+        response = await self.request(method, path, **kwargs)
+        return _parse_items(model, response.content)
+
+
+# ============================================================================
+# Service Classes
+# ============================================================================
+
+class AsyncBaseService:
+    """Base class for async API services."""
+
+    def __init__(self, client: AsyncCRMClient):
+        self.client = client
+        self._batch_supported = True
+
+    async def _get_many(
+        self, path: str, model: Type[M], ids: List[str], get: Callable[[str], Awaitable[M]]
+    ) -> List[M]:
+        """
+        Fetch several resources with concurrent POSTs of BATCH_SIZE IDs to ``path``.
+
+        Falls back to single-item GETs via ``get``, at most
+        BATCH_FALLBACK_WORKERS at a time, if the server has no batch endpoint,
+        and remembers that for later calls. Either way, IDs that are not found
+        are left out of the result.
+        """
+        if not ids:
+            return []
+
+        if self._batch_supported:
+            try:
+                pages = await asyncio.gather(
+                    *(
+                        self.client._request_items(model, "POST", path, json={"ids": chunk})
+                        for chunk in _chunks(ids, BATCH_SIZE)
+                    )
+                )
+                return [item for page in pages for item in page]
+            except CRMError as e:
+                if not _batch_unsupported(e):
+                    raise
+                self._batch_supported = False
+
+        semaphore = asyncio.Semaphore(BATCH_FALLBACK_WORKERS)
+
+        async def get_or_none(resource_id: str) -> Optional[M]:
+            async with semaphore:
+                try:
+                    return await get(resource_id)
+                except NotFoundError:
+                    return None
+
+        items = await asyncio.gather(*(get_or_none(i) for i in ids))
+        return [item for item in items if item is not None]
+
+    async def _iter_pages(
+        self, fetch: Callable[[int], Awaitable[PaginatedResponse[M]]], per_page: int
+    ) -> AsyncIterator[M]:
+        """
+        Yield the items of successive pages from ``fetch(page)`` until the last one.
+
+        The next page is requested while the current one is being consumed.
+        """
+        page = 1
+        pending = asyncio.ensure_future(fetch(page))
+        try:
+            while True:
+                result = await pending
+                last = page >= result.total_pages or len(result.data) < per_page
+                if not last:
+                    page += 1
+                    pending = asyncio.ensure_future(fetch(page))
+
+                for item in result.data:
+                    yield item
+
+                if last:
+                    return
+        finally:
+            pending.cancel()
+
+
+class AsyncAuthService(AsyncBaseService):
+    """Authentication service."""
+
+    async def login(
+        self, email: str, password: str, tenant_id: Optional[str] = None
+    ) -> LoginResponse:
+        """
+        Login with email and password.
+
+        Args:
+            email: User's email address.
+            password: User's password.
+            tenant_id: Optional tenant ID.
+
+        Returns:
+            LoginResponse with tokens and user info.
+        """
+        login = await self.client._request_model(
+            LoginResponse,
+            "POST",
+            "/api/v1/auth/login",
+            json={
+                "email": email,
+                "password": password,
+                "tenant_id": tenant_id or self.client.tenant_id,
+            },
+        )
+
+        # Store tokens
+        self.client._set_tokens(login.access_token, login.refresh_token, login.expires_in)
+
+        return login
+
+    async def logout(self) -> None:
+        """Logout and invalidate tokens."""
+        try:
+            await self.client.post("/api/v1/auth/logout")
+        finally:
+            self.client._set_tokens(None, None, None)
+
+    async def register(
+        self,
+        email: str,
+        password: str,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+    ) -> User:
+        """Register a new user."""
+        return await self.client._request_model(
+            User,
+            "POST",
+            "/api/v1/auth/register",
+            json={
+                "email": email,
+                "password": password,
+                "first_name": first_name,
+                "last_name": last_name,
+                "tenant_id": tenant_id or self.client.tenant_id,
+            },
+        )
+
+    async def me(self) -> User:
+        """Get current user info."""
+        return await self.client._request_model(User, "GET", "/api/v1/auth/me")
+
+    async def refresh(self) -> AuthTokens:
+        """Refresh access token."""
+        await self.client._refresh_access_token()
+        return AuthTokens(
+            access_token=self.client._access_token or "",
+            refresh_token=self.client._refresh_token or "",
+            token_type="Bearer",
+            expires_in=3600,
+        )
+
+
+class AsyncUserService(AsyncBaseService):
+    """User management service."""
+
+    async def list(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        status: Optional[str] = None,
+    ) -> PaginatedResponse[User]:
+        """List users."""
+        params: Dict[str, Any] = {"page": page, "per_page": per_page}
+        if status:
+            params["status"] = status
+
+        response = await self.client.request("GET", "/api/v1/users", params=params)
+        return _paginated(User, response.content, page, per_page)
+
+    def iter_all(
+        self,
+        per_page: int = MAX_PER_PAGE,
+        status: Optional[str] = None,
+    ) -> AsyncIterator[User]:
+        """Iterate over all users, fetching one page at a time."""
+        return self._iter_pages(
+            lambda page: self.list(page=page, per_page=per_page, status=status), per_page
+        )
+
+    async def get(self, user_id: str) -> User:
+        """Get user by ID."""
+        return await self.client._request_model(User, "GET", f"/api/v1/users/{user_id}")
+
+    async def create(self, user: UserCreate) -> User:
+        """Create a new user."""
+        return await self.client._request_model(
+            User, "POST", "/api/v1/users", content=_model_json(user)
+        )
+
+    async def update(self, user_id: str, user: UserUpdate) -> User:
+        """Update a user."""
+        return await self.client._request_model(
+            User,
+            "PUT",
+            f"/api/v1/users/{user_id}",
+            content=_model_json(user, exclude_unset=True),
+        )
+
+    async def delete(self, user_id: str) -> None:
+        """Delete a user."""
+        await self.client.delete(f"/api/v1/users/{user_id}")
+
+
+class AsyncTenantService(AsyncBaseService):
+    """Tenant management service."""
+
+    async def list(self, page: int = 1, per_page: int = 20) -> PaginatedResponse[Tenant]:
+        """List tenants."""
+        response = await self.client.request(
+            "GET", "/api/v1/tenants", params={"page": page, "per_page": per_page}
+        )
+        return _paginated(Tenant, response.content, page, per_page)
+
+    def iter_all(self, per_page: int = MAX_PER_PAGE) -> AsyncIterator[Tenant]:
+        """Iterate over all tenants, fetching one page at a time."""
+        return self._iter_pages(lambda page: self.list(page=page, per_page=per_page), per_page)
+
+    async def get(self, tenant_id: str) -> Tenant:
+        """Get tenant by ID."""
+        return await self.client._request_model(Tenant, "GET", f"/api/v1/tenants/{tenant_id}")
+
+    async def create(self, tenant: TenantCreate) -> Tenant:
+        """Create a new tenant."""
+        return await self.client._request_model(
+            Tenant, "POST", "/api/v1/tenants", content=_model_json(tenant)
+        )
+
+
+class AsyncCustomerService(AsyncBaseService):
+    """Customer management service."""
+
+    async def list(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> PaginatedResponse[Customer]:
+        """List customers."""
+        params: Dict[str, Any] = {"page": page, "per_page": per_page}
+        if status:
+            params["status"] = status
+        if search:
+            params["search"] = search
+
+        response = await self.client.request("GET", "/api/v1/customers", params=params)
+        return _paginated(Customer, response.content, page, per_page)
+
+    def iter_all(
+        self,
+        per_page: int = MAX_PER_PAGE,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> AsyncIterator[Customer]:
+        """Iterate over all customers, fetching one page at a time."""
+        return self._iter_pages(
+            lambda page: self.list(
+                page=page, per_page=per_page, status=status, search=search
+            ),
+            per_page,
+        )
+
+    async def get(self, customer_id: str) -> Customer:
+        """Get customer by ID."""
+        return await self.client._request_model(Customer, "GET", f"/api/v1/customers/{customer_id}")
+
+    async def get_many(self, customer_ids: List[str]) -> List[Customer]:
+        """
+        Get several customers by ID in as few requests as possible.
+
+        IDs that do not exist, or belong to another tenant, are left out of
+        the result instead of raising NotFoundError. The order of the result
+        is not guaranteed to match the order of the IDs.
+        """
+        return await self._get_many("/api/v1/customers/batch", Customer, customer_ids, self.get)
+
+    async def create(self, customer: CustomerCreate) -> Customer:
+        """Create a new customer."""
+        return await self.client._request_model(
+            Customer, "POST", "/api/v1/customers", content=_model_json(customer)
+        )
+
+    async def update(self, customer_id: str, customer: CustomerUpdate) -> Customer:
+        """Update a customer."""
+        return await self.client._request_model(
+            Customer,
+            "PUT",
+            f"/api/v1/customers/{customer_id}",
+            content=_model_json(customer, exclude_unset=True),
+        )
+
+    async def delete(self, customer_id: str) -> None:
+        """Delete a customer."""
+        await self.client.delete(f"/api/v1/customers/{customer_id}")
+
+    async def search(self, query: str, limit: int = 20) -> List[Customer]:
+        """Search customers."""
+        return await self.client._request_items(
+            Customer, "GET", "/api/v1/customers/search", params={"q": query, "limit": limit}
+        )
+
+
+class AsyncContactService(AsyncBaseService):
+    """Contact management service."""
+
+    async def list(self, customer_id: str) -> List[Contact]:
+        """List contacts for a customer."""
+        return await self.client._request_items(
+            Contact, "GET", f"/api/v1/customers/{customer_id}/contacts"
+        )
+
+    async def get(self, customer_id: str, contact_id: str) -> Contact:
+        """Get contact by ID."""
+        return await self.client._request_model(
+            Contact, "GET", f"/api/v1/customers/{customer_id}/contacts/{contact_id}"
+        )
+
+    async def create(self, customer_id: str, contact: ContactCreate) -> Contact:
+        """Create a new contact."""
+        return await self.client._request_model(
+            Contact,
+            "POST",
+            f"/api/v1/customers/{customer_id}/contacts",
+            content=_model_json(contact),
+        )
+
+    async def delete(self, customer_id: str, contact_id: str) -> None:
+        """Delete a contact."""
+        await self.client.delete(f"/api/v1/customers/{customer_id}/contacts/{contact_id}")
+
+
+class AsyncLeadService(AsyncBaseService):
+    """Lead management service."""
+
+    async def list(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        status: Optional[str] = None,
+    ) -> PaginatedResponse[Lead]:
+        """List leads."""
+        params: Dict[str, Any] = {"page": page, "per_page": per_page}
+        if status:
+            params["status"] = status
+
+        response = await self.client.request("GET", "/api/v1/leads", params=params)
+        return _paginated(Lead, response.content, page, per_page)
+
+    def iter_all(
+        self,
+        per_page: int = MAX_PER_PAGE,
+        status: Optional[str] = None,
+    ) -> AsyncIterator[Lead]:
+        """Iterate over all leads, fetching one page at a time."""
+        return self._iter_pages(
+            lambda page: self.list(page=page, per_page=per_page, status=status), per_page
+        )
+
+    async def get(self, lead_id: str) -> Lead:
+        """Get lead by ID."""
+        return await self.client._request_model(Lead, "GET", f"/api/v1/leads/{lead_id}")
+
+    async def get_many(self, lead_ids: List[str]) -> List[Lead]:
+        """
+        Get several leads by ID in as few requests as possible.
+
+        IDs that do not exist, or belong to another tenant, are left out of
+        the result instead of raising NotFoundError. The order of the result
+        is not guaranteed to match the order of the IDs.
+        """
+        return await self._get_many("/api/v1/leads/batch", Lead, lead_ids, self.get)
+
+    async def create(self, lead: LeadCreate) -> Lead:
+        """Create a new lead."""
+        return await self.client._request_model(
+            Lead, "POST", "/api/v1/leads", content=_model_json(lead)
+        )
+
+    async def update(self, lead_id: str, lead: LeadUpdate) -> Lead:
+        """Update a lead."""
+        return await self.client._request_model(
+            Lead,
+            "PUT",
+            f"/api/v1/leads/{lead_id}",
+            content=_model_json(lead, exclude_unset=True),
+        )
+
+    async def delete(self, lead_id: str) -> None:
+        """Delete a lead."""
+        await self.client.delete(f"/api/v1/leads/{lead_id}")
+
+    async def qualify(self, lead_id: str) -> Lead:
+        """Qualify a lead."""
+        return await self.client._request_model(Lead, "POST", f"/api/v1/leads/{lead_id}/qualify")
+
+    async def convert(self, lead_id: str, opportunity_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a lead to an opportunity."""
+        result: Dict[str, Any] = await self.client.post(
+            f"/api/v1/leads/{lead_id}/convert", json=opportunity_data
+        )
+        return result
+
+
+class AsyncOpportunityService(AsyncBaseService):
+    """Opportunity management service."""
+
+    async def list(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        status: Optional[str] = None,
+        pipeline_id: Optional[str] = None,
+    ) -> PaginatedResponse[Opportunity]:
+        """List opportunities."""
+        params: Dict[str, Any] = {"page": page, "per_page": per_page}
+        if status:
+            params["status"] = status
+        if pipeline_id:
+            params["pipeline_id"] = pipeline_id
+
+        response = await self.client.request("GET", "/api/v1/opportunities", params=params)
+        return _paginated(Opportunity, response.content, page, per_page)
+
+    def iter_all(
+        self,
+        per_page: int = MAX_PER_PAGE,
+        status: Optional[str] = None,
+        pipeline_id: Optional[str] = None,
+    ) -> AsyncIterator[Opportunity]:
+        """Iterate over all opportunities, fetching one page at a time."""
+        return self._iter_pages(
+            lambda page: self.list(
+                page=page, per_page=per_page, status=status, pipeline_id=pipeline_id
+            ),
+            per_page,
+        )
+
+    async def get(self, opportunity_id: str) -> Opportunity:
+        """Get opportunity by ID."""
+        return await self.client._request_model(
+            Opportunity, "GET", f"/api/v1/opportunities/{opportunity_id}"
+        )
+
+    async def get_many(self, opportunity_ids: List[str]) -> List[Opportunity]:
+        """
+        Get several opportunities by ID in as few requests as possible.
+
+        IDs that do not exist, or belong to another tenant, are left out of
+        the result instead of raising NotFoundError. The order of the result
+        is not guaranteed to match the order of the IDs.
+        """
+        return await self._get_many(
+            "/api/v1/opportunities/batch", Opportunity, opportunity_ids, self.get
+        )
+
+    async def create(self, opportunity: OpportunityCreate) -> Opportunity:
+        """Create a new opportunity."""
+        return await self.client._request_model(
+            Opportunity, "POST", "/api/v1/opportunities", content=_model_json(opportunity)
+        )
+
+    async def win(self, opportunity_id: str, reason: Optional[str] = None) -> Opportunity:
+        """Mark opportunity as won."""
+        return await self.client._request_model(
+            Opportunity,
+            "POST",
+            f"/api/v1/opportunities/{opportunity_id}/win",
+            json={"reason": reason} if reason else None,
+        )
+
+    async def lose(self, opportunity_id: str, reason: str) -> Opportunity:
+        """Mark opportunity as lost."""
+        return await self.client._request_model(
+            Opportunity,
+            "POST",
+            f"/api/v1/opportunities/{opportunity_id}/lose",
+            json={"reason": reason},
+        )
+
+
+class AsyncDealService(AsyncBaseService):
+    """Deal management service."""
+
+    async def list(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        status: Optional[str] = None,
+    ) -> PaginatedResponse[Deal]:
+        """List deals."""
+        params: Dict[str, Any] = {"page": page, "per_page": per_page}
+        if status:
+            params["status"] = status
+
+        response = await self.client.request("GET", "/api/v1/deals", params=params)
+        return _paginated(Deal, response.content, page, per_page)
+
+    def iter_all(
+        self,
+        per_page: int = MAX_PER_PAGE,
+        status: Optional[str] = None,
+    ) -> AsyncIterator[Deal]:
+        """Iterate over all deals, fetching one page at a time."""
+        return self._iter_pages(
+            lambda page: self.list(page=page, per_page=per_page, status=status), per_page
+        )
+
+    async def get(self, deal_id: str) -> Deal:
+        """Get deal by ID."""
+        return await self.client._request_model(Deal, "GET", f"/api/v1/deals/{deal_id}")
+
+
+class AsyncPipelineService(AsyncBaseService):
+    """Pipeline management service."""
+
+    async def list(self) -> List[Pipeline]:
+        """List pipelines."""
+        return await self.client._request_items(Pipeline, "GET", "/api/v1/pipelines")
+
+    async def get(self, pipeline_id: str) -> Pipeline:
+        """Get pipeline by ID."""
+        return await self.client._request_model(Pipeline, "GET", f"/api/v1/pipelines/{pipeline_id}")
@@ -4,9 +4,25 @@ CRM Platform Python SDK Client.
 Main client class for interacting with the CRM Platform API.
 """
 
-from typing import Any, Dict, List, Optional, Type, TypeVar
-from datetime import datetime, timedelta
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from enum import Enum
+from uuid import UUID
+import base64
+import importlib.util
+import json as _json
+import random
+import threading
+import time
 import httpx
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 from .models import (
     AuthTokens,
@@ -29,18 +45,278 @@ from .models import (
     Deal,
     Pipeline,
     PaginatedResponse,
+    _PAGE_ADAPTERS,
 )
 from .exceptions import (
+    CRMError,
     AuthenticationError,
     NetworkError,
+    NotFoundError,
     TimeoutError as SDKTimeoutError,
     raise_for_status,
 )
 
 T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+# HTTP/2 needs the optional ``h2`` package (``pip install "httpx[http2]"``).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool shared by all requests made through one client.
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=60.0,
+)
+
+
+# Refresh access tokens this many seconds before they expire.
+TOKEN_REFRESH_MARGIN = 300.0
+
+# Assumed access token lifetime when neither expires_in nor a JWT exp is given.
+DEFAULT_TOKEN_LIFETIME = 3600.0
 
+# Largest page size the API accepts; used by iter_all().
+MAX_PER_PAGE = 100
 
-class CRMClient:
+# Number of IDs sent per request to a batch endpoint. Larger batches save
+# round trips but delay the first result and make the server's response
+# bigger; around 50 keeps both bounded.
+BATCH_SIZE = 50
+
+# Concurrent GETs used by get_many() when the server has no batch endpoint.
+BATCH_FALLBACK_WORKERS = 8
+
+
+# Rate-limited requests were not processed, so they are retried for any
+# method. 503/504 are only retried for idempotent methods, since the server
+# may already have acted on the request.
+_RETRY_RATE_LIMITED = 429
+_RETRY_UNAVAILABLE = (503, 504)
+_IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+
+# ============================================================================
+# JSON Serialization
+# ============================================================================
+
+def _json_default(obj: Any) -> Any:
+    """Encode types the stdlib json module does not handle natively."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a request body to JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        # Non-string keys are stringified, as the stdlib json module does.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return _json.dumps(obj, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+
+def _model_json(model: BaseModel, exclude_unset: bool = False) -> bytes:
+    """Serialize a request model straight to JSON bytes, without an intermediate dict."""
+    return model.__pydantic_serializer__.to_json(model, exclude_unset=exclude_unset)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize a JSON response body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return _json.loads(data)
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Return the server's requested retry delay in seconds, if any."""
+    header = response.headers.get("Retry-After")
+    if header is not None:
+        try:
+            return float(header)
+        except ValueError:
+            pass
+    try:
+        retry_after = _json_loads(response.content).get("retry_after")
+        return float(retry_after) if retry_after is not None else None
+    except Exception:
+        return None
+
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """Return the ``exp`` claim of a JWT as a Unix timestamp, if present."""
+    try:
+        payload = token.split(".")[1]
+        claims = _json_loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except Exception:
+        return None
+
+
+class _BaseClient:
+    """
+    Configuration, authentication state and response handling shared by
+    the synchronous and asynchronous clients.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://api.crmplatform.my",
+        api_key: Optional[str] = None,
+        access_token: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        timeout: float = 30.0,
+        auto_refresh: bool = True,
+        retries: int = 3,
+        backoff_base: float = 0.25,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.tenant_id = tenant_id
+        self.timeout = timeout
+        self.auto_refresh = auto_refresh
+        self.retries = retries
+        self.backoff_base = backoff_base
+
+        self._access_token = access_token
+        self._auth_headers = self._build_auth_headers()
+        self._refresh_token: Optional[str] = None
+        # time.monotonic() deadline after which the token should be refreshed
+        self._token_refresh_at: Optional[float] = None
+
+    def _get_default_headers(self) -> Dict[str, str]:
+        """Get headers sent with every request, set once on the HTTP client."""
+        headers: Dict[str, str] = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+        if self.api_key:
+            headers["X-API-Key"] = self.api_key
+
+        if self.tenant_id:
+            headers["X-Tenant-ID"] = self.tenant_id
+
+        return headers
+
+    def _build_auth_headers(self) -> Dict[str, str]:
+        """Build the bearer header for the current access token."""
+        if not self.api_key and self._access_token:
+            return {"Authorization": f"Bearer {self._access_token}"}
+        return {}
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get per-request headers for API requests."""
+        return self._auth_headers
+
+    def _set_tokens(
+        self,
+        access_token: Optional[str],
+        refresh_token: Optional[str],
+        expires_in: Optional[int],
+    ) -> None:
+        """
+        Store tokens returned by the auth endpoints.
+
+        The token lifetime comes from ``expires_in``, which is relative and so
+        unaffected by clock skew between client and server. The JWT ``exp``
+        claim is only used when the server sends no ``expires_in``.
+        """
+        self._access_token = access_token
+        self._auth_headers = self._build_auth_headers()
+        self._refresh_token = refresh_token
+        self._token_refresh_at = None
+
+        if access_token is None:
+            return
+
+        lifetime: Optional[float] = expires_in
+        if lifetime is None:
+            exp = _jwt_expiry(access_token)
+            lifetime = exp - time.time() if exp is not None else DEFAULT_TOKEN_LIFETIME
+        self._token_refresh_at = time.monotonic() + lifetime - TOKEN_REFRESH_MARGIN
+
+    def _should_refresh_token(self) -> bool:
+        """Check if token should be refreshed."""
+        if not self.auto_refresh or not self._refresh_token:
+            return False
+        if self._token_refresh_at is None:
+            return False
+        return time.monotonic() >= self._token_refresh_at
+
+    def _handle_refresh_response(self, response: httpx.Response) -> None:
+        """Store the token returned by the refresh endpoint."""
+        if response.status_code != 200:
+            raise AuthenticationError("Failed to refresh token")
+
+        data = _json_loads(response.content)
+        self._set_tokens(data["access_token"], self._refresh_token, data.get("expires_in"))
+
+    def _retry_deadline(self) -> Optional[float]:
+        """
+        Return the monotonic time after which no retry may start, or None.
+
+        The budget is ``retries`` times the request timeout, with no limit
+        when the timeout is disabled. For an ``httpx.Timeout`` the read
+        timeout is used, falling back to the connect timeout.
+        """
+        timeout: Any = self.timeout
+        if isinstance(timeout, httpx.Timeout):
+            timeout = timeout.read if timeout.read is not None else timeout.connect
+        if timeout is None:
+            return None
+        return time.monotonic() + float(timeout) * self.retries
+
+    def _retry_delay(
+        self, method: str, response: httpx.Response, attempt: int, deadline: Optional[float]
+    ) -> Optional[float]:
+        """
+        Return how long to wait before retrying ``response``, or None to stop.
+
+        Rate-limited responses back off exponentially with jitter, but never
+        less than the server's Retry-After; 503/504 back off exponentially.
+        Retries stop after ``retries`` attempts or once the next one would
+        start past ``deadline``, if there is one.
+        """
+        if attempt >= self.retries:
+            return None
+
+        status = response.status_code
+        if status == _RETRY_RATE_LIMITED:
+            delay = self.backoff_base * 2.0 ** attempt * random.uniform(0.5, 1.5)
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+        elif status in _RETRY_UNAVAILABLE and method.upper() in _IDEMPOTENT_METHODS:
+            delay = self.backoff_base * 2.0 ** attempt
+        else:
+            return None
+
+        if deadline is not None and time.monotonic() + delay > deadline:
+            return None
+        return delay
+
+    def _handle_response(self, response: httpx.Response) -> httpx.Response:
+        """Raise the matching SDK exception for error responses."""
+        if response.status_code >= 400:
+            try:
+                error_data = _json_loads(response.content)
+            except ValueError as e:
+                # Not a JSON error body (e.g. an unknown route or a proxy page);
+                # chain the decode error so callers can tell the two apart.
+                try:
+                    raise_for_status(response.status_code, {"error": response.text})
+                except CRMError as error:
+                    raise error from e
+            raise_for_status(response.status_code, error_data)
+
+        return response
+
+
+class CRMClient(_BaseClient):
     """
     Main client for CRM Platform API.
 
@@ -58,6 +334,10 @@ class CRMClient:
         tenant_id: Optional[str] = None,
         timeout: float = 30.0,
         auto_refresh: bool = True,
+        retries: int = 3,
+        backoff_base: float = 0.25,
+        http2: bool = _HTTP2_AVAILABLE,
+        limits: httpx.Limits = DEFAULT_LIMITS,
     ):
         """
         Initialize the CRM client.
@@ -69,32 +349,78 @@ class CRMClient:
             tenant_id: Tenant ID for multi-tenant requests.
             timeout: Request timeout in seconds.
             auto_refresh: Automatically refresh expired tokens.
+            retries: Times to retry rate-limited (429) and unavailable
+                (503/504) responses; 0 disables retries.
+            backoff_base: Base delay in seconds for exponential backoff.
+            http2: Use HTTP/2 (enabled by default when ``h2`` is installed).
+            limits: Connection pool limits for the underlying HTTP client.
         """
-        self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
-        self.tenant_id = tenant_id
-        self.timeout = timeout
-        self.auto_refresh = auto_refresh
-
-        self._access_token = access_token
-        self._refresh_token: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
+        super().__init__(
+            base_url=base_url,
+            api_key=api_key,
+            access_token=access_token,
+            tenant_id=tenant_id,
+            timeout=timeout,
+            auto_refresh=auto_refresh,
+            retries=retries,
+            backoff_base=backoff_base,
+        )
 
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=timeout,
+            http2=http2,
+            limits=limits,
+            headers=self._get_default_headers(),
         )
-
-        # Initialize service clients
-        self.auth = AuthService(self)
-        self.users = UserService(self)
-        self.tenants = TenantService(self)
-        self.customers = CustomerService(self)
-        self.contacts = ContactService(self)
-        self.leads = LeadService(self)
-        self.opportunities = OpportunityService(self)
-        self.deals = DealService(self)
-        self.pipelines = PipelineService(self)
+        self._refresh_lock = threading.Lock()
+
+    # Services are created on first access, so short-lived clients only pay
+    # for the ones they use.
+    @cached_property
+    def auth(self) -> "AuthService":
+        """Authentication service."""
+        return AuthService(self)
+
+    @cached_property
+    def users(self) -> "UserService":
+        """User management service."""
+        return UserService(self)
+
+    @cached_property
+    def tenants(self) -> "TenantService":
+        """Tenant management service."""
+        return TenantService(self)
+
+    @cached_property
+    def customers(self) -> "CustomerService":
+        """Customer management service."""
+        return CustomerService(self)
+
+    @cached_property
+    def contacts(self) -> "ContactService":
+        """Contact management service."""
+        return ContactService(self)
+
+    @cached_property
+    def leads(self) -> "LeadService":
+        """Lead management service."""
+        return LeadService(self)
+
+    @cached_property
+    def opportunities(self) -> "OpportunityService":
+        """Opportunity management service."""
+        return OpportunityService(self)
+
+    @cached_property
+    def deals(self) -> "DealService":
+        """Deal management service."""
+        return DealService(self)
+
+    @cached_property
+    def pipelines(self) -> "PipelineService":
+        """Pipeline management service."""
+        return PipelineService(self)
 
     def close(self) -> None:
         """Close the HTTP client."""
@@ -106,48 +432,26 @@ class CRMClient:
     def __exit__(self, *args: Any) -> None:
         self.close()
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests."""
-        headers: Dict[str, str] = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-
-        if self.api_key:
-            headers["X-API-Key"] = self.api_key
-        elif self._access_token:
-            headers["Authorization"] = f"Bearer {self._access_token}"
-
-        if self.tenant_id:
-            headers["X-Tenant-ID"] = self.tenant_id
-
-        return headers
-
-    def _should_refresh_token(self) -> bool:
-        """Check if token should be refreshed."""
-        if not self.auto_refresh or not self._refresh_token:
-            return False
-        if not self._token_expires_at:
-            return False
-        # Refresh 5 minutes before expiry
-        return datetime.now() >= self._token_expires_at - timedelta(minutes=5)
-
-    def _refresh_access_token(self) -> None:
-        """Refresh the access token."""
-        if not self._refresh_token:
-            raise AuthenticationError("No refresh token available")
+    def _refresh_access_token(self, only_if_due: bool = False) -> None:
+        """
+        Refresh the access token.
 
-        response = self._client.post(
-            "/api/v1/auth/refresh",
-            json={"refresh_token": self._refresh_token},
-        )
+        Concurrent callers are serialized so only one refresh request is in
+        flight. With ``only_if_due``, callers that waited for another thread's
+        refresh skip their own once the new token is in place.
+        """
+        with self._refresh_lock:
+            if only_if_due and not self._should_refresh_token():
+                return
 
-        if response.status_code != 200:
-            raise AuthenticationError("Failed to refresh token")
+            if not self._refresh_token:
+                raise AuthenticationError("No refresh token available")
 
-        data = response.json()
-        self._access_token = data["access_token"]
-        self._token_expires_at = datetime.now() + timedelta(seconds=data.get("expires_in", 3600))
+            response = self._client.post(
+                "/api/v1/auth/refresh",
+                content=_json_dumps({"refresh_token": self._refresh_token}),
+            )
+            self._handle_refresh_response(response)
 
     def request(
         self,
@@ -155,6 +459,7 @@ class CRMClient:
         path: str,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
         **kwargs: Any,
     ) -> httpx.Response:
         """
@@ -165,6 +470,7 @@ class CRMClient:
             path: API endpoint path.
             params: Query parameters.
             json: JSON body data.
+            content: Pre-encoded JSON body, used when json is not given.
             **kwargs: Additional arguments passed to httpx.
 
         Returns:
@@ -176,50 +482,105 @@ class CRMClient:
             TimeoutError: On request timeout.
         """
         if self._should_refresh_token():
-            self._refresh_access_token()
+            self._refresh_access_token(only_if_due=True)
 
-        try:
-            response = self._client.request(
-                method=method,
-                url=path,
-                params=params,
-                json=json,
-                headers=self._get_headers(),
-                **kwargs,
-            )
-        except httpx.TimeoutException as e:
-            raise SDKTimeoutError(f"Request timed out: {e}", timeout=self.timeout)
-        except httpx.RequestError as e:
-            raise NetworkError(f"Network error: {e}", original_error=e)
+        if json is not None:
+            content = _json_dumps(json)
 
-        if response.status_code >= 400:
-            try:
-                error_data = response.json()
-            except Exception:
-                error_data = {"error": response.text}
-            raise_for_status(response.status_code, error_data)
+        deadline = self._retry_deadline()
+        attempt = 0
 
-        return response
+        while True:
+            try:
+                response = self._client.request(
+                    method=method,
+                    url=path,
+                    params=params,
+                    content=content,
+                    headers=self._get_headers(),
+                    **kwargs,
+                )
+            except httpx.TimeoutException as e:
+                raise SDKTimeoutError(f"Request timed out: {e}", timeout=self.timeout)
+            except httpx.RequestError as e:
+                raise NetworkError(f"Network error: {e}", original_error=e)
+
+            delay = self._retry_delay(method, response, attempt, deadline)
+            if delay is None:
+                return self._handle_response(response)
+
+            time.sleep(delay)
+            attempt += 1
 
     def get(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
         """Make a GET request."""
         response = self.request("GET", path, params=params, **kwargs)
-        return response.json()
+        return _json_loads(response.content)
 
     def post(self, path: str, json: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
         """Make a POST request."""
         response = self.request("POST", path, json=json, **kwargs)
-        return response.json()
+        return _json_loads(response.content)
 
     def put(self, path: str, json: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
         """Make a PUT request."""
         response = self.request("PUT", path, json=json, **kwargs)
-        return response.json()
+        return _json_loads(response.content)
 
     def delete(self, path: str, **kwargs: Any) -> None:
         """Make a DELETE request."""
         self.request("DELETE", path, **kwargs)
 
+    def _request_model(self, model: Type[M], method: str, path: str, **kwargs: Any) -> M:
+        """Make a request and validate the JSON response body directly as ``model``."""
+        response = self.request(method, path, **kwargs)
+        return model.model_validate_json(response.content)
+
+    def _request_items(
+        self, model: Type[M], method: str, path: str, **kwargs: Any
+    ) -> List[M]:
+        """Make a request and validate the ``data`` list of the response body as ``model``."""
+        response = self.request(method, path, **kwargs)
+        return _parse_items(model, response.content)
+
+
+# ============================================================================
+# Response Parsing
+# ============================================================================
+
+def _batch_unsupported(error: CRMError) -> bool:
+    """Whether a failed batch POST means the server has no batch endpoint."""
+    if error.status_code == 405:
+        return True
+    # An unknown route answers 404 without a JSON error body. A JSON 404 comes
+    # from a real batch handler and is passed on to the caller.
+    return error.status_code == 404 and isinstance(error.__cause__, ValueError)
+
+
+def _chunks(ids: List[str], size: int) -> List[List[str]]:
+    """Split ``ids`` into lists of at most ``size`` items."""
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+
+def _parse_items(model: Type[M], content: bytes) -> List[M]:
+    """Validate the ``data`` list of a list endpoint's JSON body as ``model``."""
+    items: List[M] = _PAGE_ADAPTERS[model].validate_json(content).get("data", [])
+    return items
+
+
+def _paginated(
+    model: Type[M], content: bytes, page: int, per_page: int
+) -> PaginatedResponse[M]:
+    """Build a paginated response from a list endpoint's JSON body."""
+    body = _PAGE_ADAPTERS[model].validate_json(content)
+    return PaginatedResponse(
+        data=body.get("data", []),
+        total=body.get("total", 0),
+        page=page,
+        per_page=per_page,
+        total_pages=body.get("total_pages", 1),
+    )
+
 
 # ============================================================================
 # Service Classes
@@ -230,6 +591,54 @@ class BaseService:
 
     def __init__(self, client: CRMClient):
         self.client = client
+        self._batch_supported = True
+
+    def _get_many(
+        self, path: str, model: Type[M], ids: List[str], get: Callable[[str], M]
+    ) -> List[M]:
+        """
+        Fetch several resources with one POST per BATCH_SIZE IDs to ``path``.
+
+        Falls back to concurrent single-item GETs via ``get`` if the server
+        has no batch endpoint, and remembers that for later calls. Either way,
+        IDs that are not found are left out of the result.
+        """
+        if not ids:
+            return []
+
+        if self._batch_supported:
+            try:
+                results: List[M] = []
+                for chunk in _chunks(ids, BATCH_SIZE):
+                    results.extend(
+                        self.client._request_items(model, "POST", path, json={"ids": chunk})
+                    )
+                return results
+            except CRMError as e:
+                if not _batch_unsupported(e):
+                    raise
+                self._batch_supported = False
+
+        def get_or_none(resource_id: str) -> Optional[M]:
+            try:
+                return get(resource_id)
+            except NotFoundError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=BATCH_FALLBACK_WORKERS) as executor:
+            return [item for item in executor.map(get_or_none, ids) if item is not None]
+
+    def _iter_pages(
+        self, fetch: Callable[[int], PaginatedResponse[M]], per_page: int
+    ) -> Iterator[M]:
+        """Yield the items of successive pages from ``fetch(page)`` until the last one."""
+        page = 1
+        while True:
+            result = fetch(page)
+            yield from result.data
+            if page >= result.total_pages or len(result.data) < per_page:
+                return
+            page += 1
 
 
 class AuthService(BaseService):
@@ -247,7 +656,9 @@ class AuthService(BaseService):
         Returns:
             LoginResponse with tokens and user info.
         """
-        data = self.client.post(
+        login = self.client._request_model(
+            LoginResponse,
+            "POST",
             "/api/v1/auth/login",
             json={
                 "email": email,
@@ -257,22 +668,16 @@ class AuthService(BaseService):
         )
 
         # Store tokens
-        self.client._access_token = data["access_token"]
-        self.client._refresh_token = data["refresh_token"]
-        self.client._token_expires_at = datetime.now() + timedelta(
-            seconds=data.get("expires_in", 3600)
-        )
+        self.client._set_tokens(login.access_token, login.refresh_token, login.expires_in)
 
-        return LoginResponse(**data)
+        return login
 
     def logout(self) -> None:
         """Logout and invalidate tokens."""
         try:
             self.client.post("/api/v1/auth/logout")
         finally:
-            self.client._access_token = None
-            self.client._refresh_token = None
-            self.client._token_expires_at = None
+            self.client._set_tokens(None, None, None)
 
     def register(
         self,
@@ -283,7 +688,9 @@ class AuthService(BaseService):
         tenant_id: Optional[str] = None,
     ) -> User:
         """Register a new user."""
-        data = self.client.post(
+        return self.client._request_model(
+            User,
+            "POST",
             "/api/v1/auth/register",
             json={
                 "email": email,
@@ -293,12 +700,10 @@ class AuthService(BaseService):
                 "tenant_id": tenant_id or self.client.tenant_id,
             },
         )
-        return User(**data)
 
     def me(self) -> User:
         """Get current user info."""
-        data = self.client.get("/api/v1/auth/me")
-        return User(**data)
+        return self.client._request_model(User, "GET", "/api/v1/auth/me")
 
     def refresh(self) -> AuthTokens:
         """Refresh access token."""
@@ -325,32 +730,35 @@ class UserService(BaseService):
         if status:
             params["status"] = status
 
-        data = self.client.get("/api/v1/users", params=params)
-        return PaginatedResponse[User](
-            data=[User(**u) for u in data.get("data", [])],
-            total=data.get("total", 0),
-            page=page,
-            per_page=per_page,
-            total_pages=data.get("total_pages", 1),
+        response = self.client.request("GET", "/api/v1/users", params=params)
+        return _paginated(User, response.content, page, per_page)
+
+    def iter_all(
+        self,
+        per_page: int = MAX_PER_PAGE,
+        status: Optional[str] = None,
+    ) -> Iterator[User]:
+        """Iterate over all users, fetching one page at a time."""
+        return self._iter_pages(
+            lambda page: self.list(page=page, per_page=per_page, status=status), per_page
         )
 
     def get(self, user_id: str) -> User:
         """Get user by ID."""
-        data = self.client.get(f"/api/v1/users/{user_id}")
-        return User(**data)
+        return self.client._request_model(User, "GET", f"/api/v1/users/{user_id}")
 
     def create(self, user: UserCreate) -> User:
         """Create a new user."""
-        data = self.client.post("/api/v1/users", json=user.model_dump())
-        return User(**data)
+        return self.client._request_model(User, "POST", "/api/v1/users", content=_model_json(user))
 
     def update(self, user_id: str, user: UserUpdate) -> User:
         """Update a user."""
-        data = self.client.put(
+        return self.client._request_model(
+            User,
+            "PUT",
             f"/api/v1/users/{user_id}",
-            json=user.model_dump(exclude_unset=True),
+            content=_model_json(user, exclude_unset=True),
         )
-        return User(**data)
 
     def delete(self, user_id: str) -> None:
         """Delete a user."""
@@ -362,24 +770,24 @@ class TenantService(BaseService):
 
     def list(self, page: int = 1, per_page: int = 20) -> PaginatedResponse[Tenant]:
         """List tenants."""
-        data = self.client.get("/api/v1/tenants", params={"page": page, "per_page": per_page})
-        return PaginatedResponse[Tenant](
-            data=[Tenant(**t) for t in data.get("data", [])],
-            total=data.get("total", 0),
-            page=page,
-            per_page=per_page,
-            total_pages=data.get("total_pages", 1),
+        response = self.client.request(
+            "GET", "/api/v1/tenants", params={"page": page, "per_page": per_page}
         )
+        return _paginated(Tenant, response.content, page, per_page)
+
+    def iter_all(self, per_page: int = MAX_PER_PAGE) -> Iterator[Tenant]:
+        """Iterate over all tenants, fetching one page at a time."""
+        return self._iter_pages(lambda page: self.list(page=page, per_page=per_page), per_page)
 
     def get(self, tenant_id: str) -> Tenant:
         """Get tenant by ID."""
-        data = self.client.get(f"/api/v1/tenants/{tenant_id}")
-        return Tenant(**data)
+        return self.client._request_model(Tenant, "GET", f"/api/v1/tenants/{tenant_id}")
 
     def create(self, tenant: TenantCreate) -> Tenant:
         """Create a new tenant."""
-        data = self.client.post("/api/v1/tenants", json=tenant.model_dump())
-        return Tenant(**data)
+        return self.client._request_model(
+            Tenant, "POST", "/api/v1/tenants", content=_model_json(tenant)
+        )
 
 
 class CustomerService(BaseService):
@@ -399,32 +807,51 @@ class CustomerService(BaseService):
         if search:
             params["search"] = search
 
-        data = self.client.get("/api/v1/customers", params=params)
-        return PaginatedResponse[Customer](
-            data=[Customer(**c) for c in data.get("data", [])],
-            total=data.get("total", 0),
-            page=page,
-            per_page=per_page,
-            total_pages=data.get("total_pages", 1),
+        response = self.client.request("GET", "/api/v1/customers", params=params)
+        return _paginated(Customer, response.content, page, per_page)
+
+    def iter_all(
+        self,
+        per_page: int = MAX_PER_PAGE,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Iterator[Customer]:
+        """Iterate over all customers, fetching one page at a time."""
+        return self._iter_pages(
+            lambda page: self.list(
+                page=page, per_page=per_page, status=status, search=search
+            ),
+            per_page,
         )
 
     def get(self, customer_id: str) -> Customer:
         """Get customer by ID."""
-        data = self.client.get(f"/api/v1/customers/{customer_id}")
-        return Customer(**data)
+        return self.client._request_model(Customer, "GET", f"/api/v1/customers/{customer_id}")
+
+    def get_many(self, customer_ids: List[str]) -> List[Customer]:
+        """
+        Get several customers by ID in as few requests as possible.
+
+        IDs that do not exist, or belong to another tenant, are left out of
+        the result instead of raising NotFoundError. The order of the result
+        is not guaranteed to match the order of the IDs.
+        """
+        return self._get_many("/api/v1/customers/batch", Customer, customer_ids, self.get)
 
     def create(self, customer: CustomerCreate) -> Customer:
         """Create a new customer."""
-        data = self.client.post("/api/v1/customers", json=customer.model_dump())
-        return Customer(**data)
+        return self.client._request_model(
+            Customer, "POST", "/api/v1/customers", content=_model_json(customer)
+        )
 
     def update(self, customer_id: str, customer: CustomerUpdate) -> Customer:
         """Update a customer."""
-        data = self.client.put(
+        return self.client._request_model(
+            Customer,
+            "PUT",
             f"/api/v1/customers/{customer_id}",
-            json=customer.model_dump(exclude_unset=True),
+            content=_model_json(customer, exclude_unset=True),
         )
-        return Customer(**data)
 
     def delete(self, customer_id: str) -> None:
         """Delete a customer."""
@@ -432,8 +859,9 @@ class CustomerService(BaseService):
 
     def search(self, query: str, limit: int = 20) -> List[Customer]:
         """Search customers."""
-        data = self.client.get("/api/v1/customers/search", params={"q": query, "limit": limit})
-        return [Customer(**c) for c in data.get("data", [])]
+        return self.client._request_items(
+            Customer, "GET", "/api/v1/customers/search", params={"q": query, "limit": limit}
+        )
 
 
 class ContactService(BaseService):
@@ -441,21 +869,24 @@ class ContactService(BaseService):
 
     def list(self, customer_id: str) -> List[Contact]:
         """List contacts for a customer."""
-        data = self.client.get(f"/api/v1/customers/{customer_id}/contacts")
-        return [Contact(**c) for c in data.get("data", [])]
+        return self.client._request_items(
+            Contact, "GET", f"/api/v1/customers/{customer_id}/contacts"
+        )
 
     def get(self, customer_id: str, contact_id: str) -> Contact:
         """Get contact by ID."""
-        data = self.client.get(f"/api/v1/customers/{customer_id}/contacts/{contact_id}")
-        return Contact(**data)
+        return self.client._request_model(
+            Contact, "GET", f"/api/v1/customers/{customer_id}/contacts/{contact_id}"
+        )
 
     def create(self, customer_id: str, contact: ContactCreate) -> Contact:
         """Create a new contact."""
-        data = self.client.post(
+        return self.client._request_model(
+            Contact,
+            "POST",
             f"/api/v1/customers/{customer_id}/contacts",
-            json=contact.model_dump(),
+            content=_model_json(contact),
         )
-        return Contact(**data)
 
     def delete(self, customer_id: str, contact_id: str) -> None:
         """Delete a contact."""
@@ -476,32 +907,45 @@ class LeadService(BaseService):
         if status:
             params["status"] = status
 
-        data = self.client.get("/api/v1/leads", params=params)
-        return PaginatedResponse[Lead](
-            data=[Lead(**l) for l in data.get("data", [])],
-            total=data.get("total", 0),
-            page=page,
-            per_page=per_page,
-            total_pages=data.get("total_pages", 1),
+        response = self.client.request("GET", "/api/v1/leads", params=params)
+        return _paginated(Lead, response.content, page, per_page)
+
+    def iter_all(
+        self,
+        per_page: int = MAX_PER_PAGE,
+        status: Optional[str] = None,
+    ) -> Iterator[Lead]:
+        """Iterate over all leads, fetching one page at a time."""
+        return self._iter_pages(
+            lambda page: self.list(page=page, per_page=per_page, status=status), per_page
         )
 
     def get(self, lead_id: str) -> Lead:
         """Get lead by ID."""
-        data = self.client.get(f"/api/v1/leads/{lead_id}")
-        return Lead(**data)
+        return self.client._request_model(Lead, "GET", f"/api/v1/leads/{lead_id}")
+
+    def get_many(self, lead_ids: List[str]) -> List[Lead]:
+        """
+        Get several leads by ID in as few requests as possible.
+
+        IDs that do not exist, or belong to another tenant, are left out of
+        the result instead of raising NotFoundError. The order of the result
+        is not guaranteed to match the order of the IDs.
+        """
+        return self._get_many("/api/v1/leads/batch", Lead, lead_ids, self.get)
 
     def create(self, lead: LeadCreate) -> Lead:
         """Create a new lead."""
-        data = self.client.post("/api/v1/leads", json=lead.model_dump())
-        return Lead(**data)
+        return self.client._request_model(Lead, "POST", "/api/v1/leads", content=_model_json(lead))
 
     def update(self, lead_id: str, lead: LeadUpdate) -> Lead:
         """Update a lead."""
-        data = self.client.put(
+        return self.client._request_model(
+            Lead,
+            "PUT",
             f"/api/v1/leads/{lead_id}",
-            json=lead.model_dump(exclude_unset=True),
+            content=_model_json(lead, exclude_unset=True),
         )
-        return Lead(**data)
 
     def delete(self, lead_id: str) -> None:
         """Delete a lead."""
@@ -509,8 +953,7 @@ class LeadService(BaseService):
 
     def qualify(self, lead_id: str) -> Lead:
         """Qualify a lead."""
-        data = self.client.post(f"/api/v1/leads/{lead_id}/qualify")
-        return Lead(**data)
+        return self.client._request_model(Lead, "POST", f"/api/v1/leads/{lead_id}/qualify")
 
     def convert(self, lead_id: str, opportunity_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert a lead to an opportunity."""
@@ -534,40 +977,62 @@ class OpportunityService(BaseService):
         if pipeline_id:
             params["pipeline_id"] = pipeline_id
 
-        data = self.client.get("/api/v1/opportunities", params=params)
-        return PaginatedResponse[Opportunity](
-            data=[Opportunity(**o) for o in data.get("data", [])],
-            total=data.get("total", 0),
-            page=page,
-            per_page=per_page,
-            total_pages=data.get("total_pages", 1),
+        response = self.client.request("GET", "/api/v1/opportunities", params=params)
+        return _paginated(Opportunity, response.content, page, per_page)
+
+    def iter_all(
+        self,
+        per_page: int = MAX_PER_PAGE,
+        status: Optional[str] = None,
+        pipeline_id: Optional[str] = None,
+    ) -> Iterator[Opportunity]:
+        """Iterate over all opportunities, fetching one page at a time."""
+        return self._iter_pages(
+            lambda page: self.list(
+                page=page, per_page=per_page, status=status, pipeline_id=pipeline_id
+            ),
+            per_page,
         )
 
     def get(self, opportunity_id: str) -> Opportunity:
         """Get opportunity by ID."""
-        data = self.client.get(f"/api/v1/opportunities/{opportunity_id}")
-        return Opportunity(**data)
+        return self.client._request_model(
+            Opportunity, "GET", f"/api/v1/opportunities/{opportunity_id}"
+        )
+
+    def get_many(self, opportunity_ids: List[str]) -> List[Opportunity]:
+        """
+        Get several opportunities by ID in as few requests as possible.
+
+        IDs that do not exist, or belong to another tenant, are left out of
+        the result instead of raising NotFoundError. The order of the result
+        is not guaranteed to match the order of the IDs.
+        """
+        return self._get_many("/api/v1/opportunities/batch", Opportunity, opportunity_ids, self.get)
 
     def create(self, opportunity: OpportunityCreate) -> Opportunity:
         """Create a new opportunity."""
-        data = self.client.post("/api/v1/opportunities", json=opportunity.model_dump())
-        return Opportunity(**data)
+        return self.client._request_model(
+            Opportunity, "POST", "/api/v1/opportunities", content=_model_json(opportunity)
+        )
 
     def win(self, opportunity_id: str, reason: Optional[str] = None) -> Opportunity:
         """Mark opportunity as won."""
-        data = self.client.post(
+        return self.client._request_model(
+            Opportunity,
+            "POST",
             f"/api/v1/opportunities/{opportunity_id}/win",
             json={"reason": reason} if reason else None,
         )
-        return Opportunity(**data)
 
     def lose(self, opportunity_id: str, reason: str) -> Opportunity:
         """Mark opportunity as lost."""
-        data = self.client.post(
+        return self.client._request_model(
+            Opportunity,
+            "POST",
             f"/api/v1/opportunities/{opportunity_id}/lose",
             json={"reason": reason},
         )
-        return Opportunity(**data)
 
 
 class DealService(BaseService):
@@ -584,19 +1049,22 @@ class DealService(BaseService):
         if status:
             params["status"] = status
 
-        data = self.client.get("/api/v1/deals", params=params)
-        return PaginatedResponse[Deal](
-            data=[Deal(**d) for d in data.get("data", [])],
-            total=data.get("total", 0),
-            page=page,
-            per_page=per_page,
-            total_pages=data.get("total_pages", 1),
+        response = self.client.request("GET", "/api/v1/deals", params=params)
+        return _paginated(Deal, response.content, page, per_page)
+
+    def iter_all(
+        self,
+        per_page: int = MAX_PER_PAGE,
+        status: Optional[str] = None,
+    ) -> Iterator[Deal]:
+        """Iterate over all deals, fetching one page at a time."""
+        return self._iter_pages(
+            lambda page: self.list(page=page, per_page=per_page, status=status), per_page
         )
 
     def get(self, deal_id: str) -> Deal:
         """Get deal by ID."""
-        data = self.client.get(f"/api/v1/deals/{deal_id}")
-        return Deal(**data)
+        return self.client._request_model(Deal, "GET", f"/api/v1/deals/{deal_id}")
 
 
 class PipelineService(BaseService):
@@ -604,10 +1072,8 @@ class PipelineService(BaseService):
 
     def list(self) -> List[Pipeline]:
         """List pipelines."""
-        data = self.client.get("/api/v1/pipelines")
-        return [Pipeline(**p) for p in data.get("data", [])]
+        return self.client._request_items(Pipeline, "GET", "/api/v1/pipelines")
 
     def get(self, pipeline_id: str) -> Pipeline:
         """Get pipeline by ID."""
-        data = self.client.get(f"/api/v1/pipelines/{pipeline_id}")
-        return Pipeline(**data)
+        return self.client._request_model(Pipeline, "GET", f"/api/v1/pipelines/{pipeline_id}")
@@ -2,12 +2,14 @@
 Exceptions for CRM Platform SDK.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Type
 
 
 class CRMError(Exception):
     """Base exception for CRM SDK errors."""
 
+    __slots__ = ("message", "status_code", "error_code", "details")
+
     def __init__(
         self,
         message: str,
@@ -37,10 +39,24 @@ class CRMError(Exception):
             f"error_code={self.error_code!r})"
         )
 
+    def __reduce__(self) -> Any:
+        # Slot attributes are not part of the default exception pickle state,
+        # which only covers the instance __dict__ (e.g. __notes__).
+        slot_state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+        state = {**getattr(self, "__dict__", {}), **slot_state}
+        return (type(self), self.args, state)
+
 
 class AuthenticationError(CRMError):
     """Raised when authentication fails."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Authentication failed",
@@ -58,6 +74,8 @@ class AuthenticationError(CRMError):
 class AuthorizationError(CRMError):
     """Raised when user lacks permission for an action."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Permission denied",
@@ -75,11 +93,14 @@ class AuthorizationError(CRMError):
 class NotFoundError(CRMError):
     """Raised when a resource is not found."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Resource not found",
         resource_type: Optional[str] = None,
         resource_id: Optional[str] = None,
+        error_code: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
     ):
         details = details or {}
@@ -91,7 +112,7 @@ class NotFoundError(CRMError):
         super().__init__(
             message=message,
             status_code=404,
-            error_code="NOT_FOUND",
+            error_code=error_code or "NOT_FOUND",
             details=details,
         )
 
@@ -99,10 +120,13 @@ class NotFoundError(CRMError):
 class ValidationError(CRMError):
     """Raised when request validation fails."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Validation failed",
         errors: Optional[Dict[str, Any]] = None,
+        error_code: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
     ):
         details = details or {}
@@ -112,7 +136,7 @@ class ValidationError(CRMError):
         super().__init__(
             message=message,
             status_code=400,
-            error_code="VALIDATION_ERROR",
+            error_code=error_code or "VALIDATION_ERROR",
             details=details,
         )
 
@@ -120,6 +144,8 @@ class ValidationError(CRMError):
 class ConflictError(CRMError):
     """Raised when there's a conflict (e.g., duplicate resource)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Resource conflict",
@@ -137,10 +163,13 @@ class ConflictError(CRMError):
 class RateLimitError(CRMError):
     """Raised when rate limit is exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
         retry_after: Optional[int] = None,
+        error_code: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
     ):
         details = details or {}
@@ -150,7 +179,7 @@ class RateLimitError(CRMError):
         super().__init__(
             message=message,
             status_code=429,
-            error_code="RATE_LIMIT_EXCEEDED",
+            error_code=error_code or "RATE_LIMIT_EXCEEDED",
             details=details,
         )
         self.retry_after = retry_after
@@ -159,6 +188,8 @@ class RateLimitError(CRMError):
 class ServerError(CRMError):
     """Raised when the server returns a 5xx error."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Server error",
@@ -177,6 +208,8 @@ class ServerError(CRMError):
 class NetworkError(CRMError):
     """Raised when there's a network connectivity issue."""
 
+    __slots__ = ("original_error",)
+
     def __init__(
         self,
         message: str = "Network error",
@@ -199,6 +232,8 @@ class NetworkError(CRMError):
 class TimeoutError(CRMError):
     """Raised when a request times out."""
 
+    __slots__ = ("timeout",)
+
     def __init__(
         self,
         message: str = "Request timed out",
@@ -218,58 +253,48 @@ class TimeoutError(CRMError):
         self.timeout = timeout
 
 
+# Exception raised for each 4xx status code with a dedicated class.
+_STATUS_MAP: Dict[int, Type[CRMError]] = {
+    400: ValidationError,
+    401: AuthenticationError,
+    403: AuthorizationError,
+    404: NotFoundError,
+    409: ConflictError,
+    429: RateLimitError,
+}
+
+# Response fields passed through as extra keyword arguments, by status code.
+_STATUS_FIELDS: Dict[int, str] = {
+    400: "errors",
+    429: "retry_after",
+}
+
+
 def raise_for_status(status_code: int, response_data: Dict[str, Any]) -> None:
     """Raise appropriate exception based on status code."""
     error_message = response_data.get("error", response_data.get("message", "Unknown error"))
     error_code = response_data.get("code")
     details = response_data.get("details", {})
 
-    if status_code == 400:
-        raise ValidationError(
-            message=error_message,
-            errors=response_data.get("errors"),
-            details=details,
-        )
-    elif status_code == 401:
-        raise AuthenticationError(
-            message=error_message,
-            error_code=error_code,
-            details=details,
-        )
-    elif status_code == 403:
-        raise AuthorizationError(
-            message=error_message,
-            error_code=error_code,
-            details=details,
-        )
-    elif status_code == 404:
-        raise NotFoundError(
-            message=error_message,
-            details=details,
-        )
-    elif status_code == 409:
-        raise ConflictError(
-            message=error_message,
-            error_code=error_code,
-            details=details,
-        )
-    elif status_code == 429:
-        raise RateLimitError(
-            message=error_message,
-            retry_after=response_data.get("retry_after"),
-            details=details,
-        )
-    elif status_code >= 500:
+    exc_cls = _STATUS_MAP.get(status_code)
+    if exc_cls is not None:
+        kwargs: Dict[str, Any] = {}
+        field = _STATUS_FIELDS.get(status_code)
+        if field is not None:
+            kwargs[field] = response_data.get(field)
+        raise exc_cls(message=error_message, error_code=error_code, details=details, **kwargs)
+
+    if status_code >= 500:
         raise ServerError(
             message=error_message,
             status_code=status_code,
             error_code=error_code,
             details=details,
         )
-    else:
-        raise CRMError(
-            message=error_message,
-            status_code=status_code,
-            error_code=error_code,
-            details=details,
-        )
+
+    raise CRMError(
+        message=error_message,
+        status_code=status_code,
+        error_code=error_code,
+        details=details,
+    )
@@ -5,8 +5,12 @@ All models use Pydantic for validation and serialization.
 """
 
 from datetime import datetime
-from typing import Any, Generic, List, Optional, TypeVar
-from pydantic import BaseModel, Field
+from decimal import Decimal
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Dict, Generic, Iterable, List, Mapping, Optional, Tuple, Type, TypeVar
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing_extensions import TypedDict
 from enum import Enum
 
 
@@ -63,8 +67,7 @@ class BaseEntity(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -78,6 +81,8 @@ class AuthTokens(BaseModel):
     token_type: str = "Bearer"
     expires_in: int
 
+    model_config = ConfigDict(frozen=True)
+
 
 class UserInfo(BaseModel):
     """Basic user info returned with auth."""
@@ -86,6 +91,8 @@ class UserInfo(BaseModel):
     first_name: Optional[str] = None
     last_name: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class LoginResponse(BaseModel):
     """Response from login endpoint."""
@@ -95,6 +102,8 @@ class LoginResponse(BaseModel):
     expires_in: int
     user: UserInfo
 
+    model_config = ConfigDict(frozen=True)
+
 
 # ============================================================================
 # User Models
@@ -116,8 +125,10 @@ class User(BaseEntity):
     @property
     def full_name(self) -> str:
         """Get user's full name."""
-        parts = [self.first_name, self.last_name]
-        return " ".join(p for p in parts if p) or self.email
+        first, last = self.first_name, self.last_name
+        if first and last:
+            return f"{first} {last}"
+        return first or last or self.email
 
 
 class UserCreate(BaseModel):
@@ -169,6 +180,8 @@ class Email(BaseModel):
     type: str = "work"
     is_primary: bool = False
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Phone(BaseModel):
     """Phone number with metadata."""
@@ -176,6 +189,8 @@ class Phone(BaseModel):
     type: str = "work"
     is_primary: bool = False
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Address(BaseModel):
     """Physical address."""
@@ -185,6 +200,8 @@ class Address(BaseModel):
     postal_code: Optional[str] = None
     country: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Customer(BaseEntity):
     """Customer entity."""
@@ -248,8 +265,10 @@ class Contact(BaseEntity):
     @property
     def full_name(self) -> str:
         """Get contact's full name."""
-        parts = [self.first_name, self.last_name]
-        return " ".join(p for p in parts if p)
+        first, last = self.first_name, self.last_name
+        if first and last:
+            return f"{first} {last}"
+        return first or last or ""
 
 
 class ContactCreate(BaseModel):
@@ -327,6 +346,8 @@ class PipelineStage(BaseModel):
     probability: int = 0
     color: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Pipeline(BaseEntity):
     """Sales pipeline."""
@@ -335,7 +356,27 @@ class Pipeline(BaseEntity):
     description: Optional[str] = None
     is_default: bool = False
     status: str = "active"
-    stages: List[PipelineStage] = Field(default_factory=list)
+    stages: Tuple[PipelineStage, ...] = ()
+
+    @property
+    def stages_by_id(self) -> Mapping[str, PipelineStage]:
+        """Get a read-only view of the stages keyed by stage ID."""
+        stages, by_id = self._stage_index
+        if stages is not self.stages:
+            # Copied with new stages via model_copy(update=...). Overwrite the
+            # entry rather than deleting it, so concurrent readers never miss it.
+            stages = self.stages
+            by_id = {stage.id: stage for stage in stages}
+            self.__dict__["_stage_index"] = (stages, by_id)
+        return MappingProxyType(by_id)
+
+    def stage(self, stage_id: str) -> Optional[PipelineStage]:
+        """Get a stage by ID, or None if it is not in this pipeline."""
+        return self.stages_by_id.get(stage_id)
+
+    @cached_property
+    def _stage_index(self) -> Tuple[Tuple[PipelineStage, ...], Dict[str, PipelineStage]]:
+        return self.stages, {stage.id: stage for stage in self.stages}
 
 
 # ============================================================================
@@ -347,10 +388,38 @@ class Money(BaseModel):
     amount: int  # In cents
     currency: str = "MYR"
 
+    model_config = ConfigDict(frozen=True)
+
     @property
-    def decimal_amount(self) -> float:
-        """Get amount as decimal."""
-        return self.amount / 100
+    def decimal_amount(self) -> Decimal:
+        """Get amount as an exact decimal with two places."""
+        return Decimal(self.amount).scaleb(-2)
+
+    @classmethod
+    def sum(cls, items: Iterable["Money"], currency: Optional[str] = None) -> "Money":
+        """
+        Add up monetary values in integer cents.
+
+        Args:
+            items: Values to add, all in the same currency
+            currency: Currency of the result when items is empty
+
+        Returns:
+            Total as a single Money value
+
+        Raises:
+            ValueError: If the items use more than one currency
+        """
+        total = 0
+        for item in items:
+            if currency is None:
+                currency = item.currency
+            elif item.currency != currency:
+                raise ValueError(f"Cannot sum {item.currency} with {currency}")
+            total += item.amount
+        if currency is None:
+            return cls(amount=total)
+        return cls(amount=total, currency=currency)
 
 
 class Opportunity(BaseEntity):
@@ -402,6 +471,25 @@ class DealLineItem(BaseModel):
     tax_percent: int = 0
     total_amount: int
 
+    model_config = ConfigDict(frozen=True)
+
+    def compute_total(self) -> int:
+        """
+        Calculate the line total in cents from quantity, price, discount and tax.
+
+        Rounds the discount and the tax to the nearest cent separately, the
+        same way the server does.
+        """
+        base = self.quantity * self.unit_price
+        subtotal = base - _percent_of(base, self.discount_percent)
+        return subtotal + _percent_of(subtotal, self.tax_percent)
+
+
+def _percent_of(amount: int, percent: int) -> int:
+    """Integer percentage of an amount in cents, rounded half away from zero."""
+    value = (abs(amount) * percent + 50) // 100
+    return value if amount >= 0 else -value
+
 
 class Deal(BaseEntity):
     """Closed deal."""
@@ -420,6 +508,28 @@ class Deal(BaseEntity):
     line_items: List[DealLineItem] = Field(default_factory=list)
     metadata: dict = Field(default_factory=dict)
 
+    def recompute_totals(self) -> "Deal":
+        """
+        Recalculate line item totals and the deal value locally.
+
+        The value is left unchanged when the deal has no line items.
+
+        Returns:
+            Copy of the deal with updated line_items and value
+        """
+        if not self.line_items:
+            return self
+        items = []
+        total = 0
+        for item in self.line_items:
+            amount = item.compute_total()
+            total += amount
+            if amount != item.total_amount:
+                item = item.model_copy(update={"total_amount": amount})
+            items.append(item)
+        value = Money(amount=total, currency=self.value.currency)
+        return self.model_copy(update={"line_items": items, "value": value})
+
 
 # ============================================================================
 # Pagination Models
@@ -428,13 +538,42 @@ class Deal(BaseEntity):
 T = TypeVar("T")
 
 
-class PaginatedResponse(BaseModel, Generic[T]):
-    """Paginated response wrapper."""
-    data: List[T]
-    total: int
-    page: int = 1
-    per_page: int = 20
-    total_pages: int = 1
+class PaginatedResponse(Generic[T]):
+    """
+    Paginated response wrapper.
+
+    A plain slotted container rather than a model: the items are validated
+    on their own, so the envelope needs no validation or per-type schema.
+    """
+
+    __slots__ = ("data", "total", "page", "per_page", "total_pages")
+
+    def __init__(
+        self,
+        data: List[T],
+        total: int,
+        page: int = 1,
+        per_page: int = 20,
+        total_pages: int = 1,
+    ):
+        self.data = data
+        self.total = total
+        self.page = page
+        self.per_page = per_page
+        self.total_pages = total_pages
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"total={self.total}, page={self.page}, "
+            f"per_page={self.per_page}, total_pages={self.total_pages}, "
+            f"data=<{len(self.data)} items>)"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PaginatedResponse):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
 
     @property
     def has_next(self) -> bool:
@@ -447,6 +586,13 @@ class PaginatedResponse(BaseModel, Generic[T]):
         return self.page > 1
 
 
+class _PageBody(TypedDict, Generic[T], total=False):
+    """JSON body returned by list endpoints."""
+    data: List[T]
+    total: int
+    total_pages: int
+
+
 # ============================================================================
 # Activity Models
 # ============================================================================
@@ -476,3 +622,42 @@ class Note(BaseEntity):
     content: str
     is_pinned: bool = False
     created_by: str
+
+
+# ============================================================================
+# Page Adapters
+# ============================================================================
+
+# Validators for list endpoint bodies, built once at import. A whole page is
+# validated straight from the JSON bytes in one call, without first decoding
+# it into Python dicts.
+_PAGE_ADAPTERS: Dict[type, TypeAdapter[Any]] = {
+    model: TypeAdapter(_PageBody[model])  # type: ignore[valid-type]
+    for model in (User, Tenant, Customer, Contact, Lead, Opportunity, Deal, Pipeline)
+}
+
+_LIST_ADAPTERS: Dict[type, TypeAdapter[Any]] = {}
+
+E = TypeVar("E", bound=BaseModel)
+
+
+def validate_list(model: Type[E], rows: Iterable[Any]) -> List[E]:
+    """
+    Validate many rows as ``model`` in a single call.
+
+    Faster than validating row by row, since the loop runs inside
+    pydantic-core. Rows may be dicts, or objects for models that allow
+    ``from_attributes``.
+
+    Args:
+        model: Model class to validate each row as
+        rows: Row data
+
+    Returns:
+        List of validated models
+    """
+    adapter = _LIST_ADAPTERS.get(model)
+    if adapter is None:
+        adapter = _LIST_ADAPTERS[model] = TypeAdapter(List[model])  # type: ignore[valid-type]
+    result: List[E] = adapter.validate_python(rows)
+    return result
@@ -0,0 +1,79 @@
+"""
+Shared fixtures for the CRM SDK tests.
+
+Clients are wired to ``httpx.MockTransport`` so tests script the server's
+responses without opening sockets.
+"""
+
+from typing import Any, AsyncIterator, Callable, Dict, Iterator
+
+import httpx
+import pytest
+
+from crm_sdk import AsyncCRMClient, CRMClient
+
+BASE_URL = "https://api.test"
+NOW = "2024-01-01T00:00:00Z"
+
+
+def customer_json(customer_id: str) -> Dict[str, Any]:
+    """Minimal customer body as returned by the API."""
+    return {
+        "id": customer_id,
+        "tenant_id": "tenant-1",
+        "code": f"C-{customer_id}",
+        "name": f"Customer {customer_id}",
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+
+
+def login_json(expires_in: int = 3600) -> Dict[str, Any]:
+    """Login response body with access token ``A`` and refresh token ``R``."""
+    return {
+        "access_token": "A",
+        "refresh_token": "R",
+        "expires_in": expires_in,
+        "user": {"id": "user-1", "email": "user@example.com"},
+    }
+
+
+@pytest.fixture
+def make_client() -> Iterator[Callable[..., CRMClient]]:
+    """Build a CRMClient whose requests are answered by ``handler``."""
+    clients = []
+
+    def factory(handler: Callable[[httpx.Request], httpx.Response], **kwargs: Any) -> CRMClient:
+        client = CRMClient(base_url=BASE_URL, **kwargs)
+        headers = client._client.headers
+        client._client.close()
+        client._client = httpx.Client(
+            base_url=BASE_URL, headers=headers, transport=httpx.MockTransport(handler)
+        )
+        clients.append(client)
+        return client
+
+    yield factory
+
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+async def make_async_client() -> AsyncIterator[Callable[..., AsyncCRMClient]]:
+    """Build an AsyncCRMClient whose requests are answered by ``handler``."""
+    clients = []
+
+    def factory(handler: Callable[[httpx.Request], Any], **kwargs: Any) -> AsyncCRMClient:
+        client = AsyncCRMClient(base_url=BASE_URL, **kwargs)
+        headers = client._client.headers
+        client._client = httpx.AsyncClient(
+            base_url=BASE_URL, headers=headers, transport=httpx.MockTransport(handler)
+        )
+        clients.append(client)
+        return client
+
+    yield factory
+
+    for client in clients:
+        await client.close()
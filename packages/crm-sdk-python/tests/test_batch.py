@@ -0,0 +1,112 @@
+"""Tests for get_many and its single-item fallback."""
+
+import asyncio
+import json
+from typing import Callable, List
+
+import httpx
+import pytest
+
+from crm_sdk import NotFoundError
+from crm_sdk.client import BATCH_FALLBACK_WORKERS
+
+from conftest import customer_json
+
+
+def _handler(
+    batch: Callable[[httpx.Request], httpx.Response], calls: List[str]
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Serve single customers, answering the batch endpoint with ``batch``."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        calls.append(path)
+        if path == "/api/v1/customers/batch":
+            return batch(request)
+        customer_id = path.rsplit("/", 1)[1]
+        if customer_id == "missing":
+            return httpx.Response(404, json={"error": "customer not found"})
+        return httpx.Response(200, json=customer_json(customer_id))
+
+    return handler
+
+
+def test_get_many_uses_batch_endpoint(make_client):
+    calls: List[str] = []
+
+    def batch(request: httpx.Request) -> httpx.Response:
+        ids = json.loads(request.content)["ids"]
+        found = [customer_json(i) for i in ids if i != "missing"]
+        return httpx.Response(200, json={"data": found})
+
+    client = make_client(_handler(batch, calls))
+
+    customers = client.customers.get_many(["1", "missing", "2"])
+
+    assert [c.id for c in customers] == ["1", "2"]
+    assert calls == ["/api/v1/customers/batch"]
+
+
+def test_get_many_falls_back_on_405(make_client):
+    calls: List[str] = []
+    client = make_client(_handler(lambda request: httpx.Response(405), calls))
+
+    customers = client.customers.get_many(["1", "missing", "2"])
+
+    assert [c.id for c in customers] == ["1", "2"]
+    assert calls.count("/api/v1/customers/batch") == 1
+
+    client.customers.get_many(["3"])
+
+    assert calls.count("/api/v1/customers/batch") == 1
+
+
+def test_get_many_falls_back_on_404_without_json_body(make_client):
+    calls: List[str] = []
+    client = make_client(
+        _handler(lambda request: httpx.Response(404, text="404 page not found\n"), calls)
+    )
+
+    customers = client.customers.get_many(["1", "2"])
+
+    assert [c.id for c in customers] == ["1", "2"]
+
+
+def test_get_many_raises_json_404_from_batch_endpoint(make_client):
+    calls: List[str] = []
+    client = make_client(
+        _handler(lambda request: httpx.Response(404, json={"error": "tenant not found"}), calls)
+    )
+
+    with pytest.raises(NotFoundError):
+        client.customers.get_many(["1", "2"])
+
+    assert calls == ["/api/v1/customers/batch"]
+    assert client.customers._batch_supported
+
+
+async def test_async_get_many_fallback_is_bounded(make_async_client):
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        path = request.url.path
+        if path == "/api/v1/customers/batch":
+            return httpx.Response(405)
+        customer_id = path.rsplit("/", 1)[1]
+        if customer_id == "missing":
+            return httpx.Response(404, json={"error": "customer not found"})
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=customer_json(customer_id))
+
+    client = make_async_client(handler)
+    ids = [str(i) for i in range(40)] + ["missing"]
+
+    customers = await client.customers.get_many(ids)
+
+    assert sorted(c.id for c in customers) == sorted(ids[:-1])
+    assert peak == BATCH_FALLBACK_WORKERS
@@ -0,0 +1,124 @@
+"""Tests for SDK exceptions."""
+
+import copy
+import pickle
+import sys
+
+import pytest
+
+from crm_sdk.exceptions import (
+    AuthenticationError,
+    AuthorizationError,
+    ConflictError,
+    CRMError,
+    NetworkError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    TimeoutError,
+    ValidationError,
+    raise_for_status,
+)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        CRMError("boom", status_code=418, error_code="TEAPOT", details={"a": 1}),
+        NotFoundError("no customer", resource_type="customer", resource_id="c-1"),
+        ValidationError("bad input", errors={"name": "required"}),
+        RateLimitError("slow down", retry_after=5),
+        NetworkError("offline", original_error=OSError("unreachable")),
+        TimeoutError("too slow", timeout=2.5),
+    ],
+)
+@pytest.mark.parametrize("round_trip", [lambda e: pickle.loads(pickle.dumps(e)), copy.copy])
+def test_round_trip_keeps_slot_attributes(error, round_trip):
+    restored = round_trip(error)
+
+    assert type(restored) is type(error)
+    assert restored.args == error.args
+    for cls in type(error).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            assert repr(getattr(restored, name)) == repr(getattr(error, name))
+
+
+def test_round_trip_keeps_instance_dict():
+    error = NotFoundError("no customer")
+    error.request_id = "req-1"
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert restored.request_id == "req-1"
+    assert restored.error_code == "NOT_FOUND"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="add_note needs Python 3.11")
+def test_round_trip_keeps_notes():
+    error = RateLimitError("slow down", retry_after=5)
+    error.add_note("while listing customers")
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert restored.__notes__ == ["while listing customers"]
+    assert restored.retry_after == 5
+
+
+@pytest.mark.parametrize(
+    "status_code, error_class, default_code",
+    [
+        (400, ValidationError, "VALIDATION_ERROR"),
+        (401, AuthenticationError, "AUTHENTICATION_ERROR"),
+        (403, AuthorizationError, "AUTHORIZATION_ERROR"),
+        (404, NotFoundError, "NOT_FOUND"),
+        (409, ConflictError, "CONFLICT"),
+        (429, RateLimitError, "RATE_LIMIT_EXCEEDED"),
+        (500, ServerError, "SERVER_ERROR"),
+        (502, ServerError, "SERVER_ERROR"),
+        (503, ServerError, "SERVER_ERROR"),
+        (418, CRMError, None),
+        (422, CRMError, None),
+    ],
+)
+def test_raise_for_status_maps_status_to_exception(status_code, error_class, default_code):
+    with pytest.raises(CRMError) as exc_info:
+        raise_for_status(status_code, {"error": "went wrong"})
+
+    error = exc_info.value
+    assert type(error) is error_class
+    assert error.status_code == status_code
+    assert error.message == "went wrong"
+    assert error.error_code == default_code
+
+
+@pytest.mark.parametrize("status_code", [400, 401, 403, 404, 409, 429, 500, 418])
+def test_raise_for_status_keeps_server_error_code(status_code):
+    with pytest.raises(CRMError) as exc_info:
+        raise_for_status(status_code, {"message": "went wrong", "code": "SERVER_SAYS"})
+
+    assert exc_info.value.error_code == "SERVER_SAYS"
+    assert exc_info.value.message == "went wrong"
+
+
+def test_raise_for_status_moves_validation_errors_into_details():
+    errors = {"email": "invalid", "name": "required"}
+
+    with pytest.raises(ValidationError) as exc_info:
+        raise_for_status(400, {"error": "invalid", "errors": errors, "details": {"field": "x"}})
+
+    assert exc_info.value.details == {"field": "x", "validation_errors": errors}
+
+
+def test_raise_for_status_carries_retry_after():
+    with pytest.raises(RateLimitError) as exc_info:
+        raise_for_status(429, {"error": "slow down", "retry_after": 30})
+
+    assert exc_info.value.retry_after == 30
+    assert exc_info.value.details["retry_after"] == 30
+
+
+def test_raise_for_status_defaults_message():
+    with pytest.raises(NotFoundError) as exc_info:
+        raise_for_status(404, {})
+
+    assert exc_info.value.message == "Unknown error"
@@ -0,0 +1,60 @@
+"""Tests for request body encoding with and without orjson."""
+
+import json
+from datetime import date, datetime, timezone
+from enum import Enum
+from uuid import UUID
+
+import pytest
+
+import crm_sdk.client
+from crm_sdk.client import _json_dumps
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class Size(str, Enum):
+    LARGE = "large"
+
+
+BODIES = [
+    {1: "x", 2.5: "y", None: "z"},
+    {"color": Color.RED, "size": Size.LARGE},
+    {"at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "on": date(2024, 1, 2)},
+    {"id": UUID("12345678-1234-5678-1234-567812345678")},
+    {"nested": [{"n": 1}, (2, 3)], "none": None},
+]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(crm_sdk.client, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("body", BODIES)
+def test_both_encoders_accept_the_same_bodies(encoder, body):
+    encoded = json.loads(_json_dumps(body))
+
+    assert len(encoded) == len(body)
+
+
+def test_encoders_produce_the_same_json(monkeypatch):
+    pytest.importorskip("orjson")
+    fast = [json.loads(_json_dumps(body)) for body in BODIES]
+    monkeypatch.setattr(crm_sdk.client, "orjson", None)
+    slow = [json.loads(_json_dumps(body)) for body in BODIES]
+
+    assert fast == slow
+    assert fast[0] == {"1": "x", "2.5": "y", "null": "z"}
+    assert fast[1] == {"color": "red", "size": "large"}
+
+
+def test_unsupported_types_fail_on_both_encoders(encoder):
+    with pytest.raises(TypeError):
+        _json_dumps({"value": object()})
@@ -0,0 +1,161 @@
+"""Tests for model helpers."""
+
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Any, Dict
+
+import pytest
+
+from crm_sdk.models import Deal, DealLineItem, Money, Pipeline, PipelineStage
+
+from conftest import NOW
+
+
+def _stage(stage_id: str, order: int) -> Dict[str, Any]:
+    return {"id": stage_id, "pipeline_id": "p-1", "name": stage_id.title(), "order": order}
+
+
+@pytest.fixture
+def pipeline() -> Pipeline:
+    return Pipeline.model_validate(
+        {
+            "id": "p-1",
+            "tenant_id": "tenant-1",
+            "name": "Sales",
+            "stages": [_stage("new", 1), _stage("won", 2)],
+            "created_at": NOW,
+            "updated_at": NOW,
+        }
+    )
+
+
+def test_stage_looks_up_by_id(pipeline):
+    assert pipeline.stage("won") is pipeline.stages[1]
+    assert pipeline.stage("missing") is None
+
+
+def test_stages_by_id_is_read_only(pipeline):
+    with pytest.raises(TypeError):
+        pipeline.stages_by_id["lost"] = pipeline.stages[0]  # type: ignore[index]
+
+    assert pipeline.stage("lost") is None
+
+
+def test_stage_index_follows_model_copy_with_new_stages(pipeline):
+    assert pipeline.stage("new") is not None
+    lost = PipelineStage.model_validate(_stage("lost", 3))
+
+    copied = pipeline.model_copy(update={"stages": (lost,)})
+
+    assert copied.stage("lost") is lost
+    assert copied.stage("new") is None
+    assert pipeline.stage("lost") is None
+
+
+def test_stale_stage_index_is_rebuilt_safely_across_threads(pipeline):
+    lost = PipelineStage.model_validate(_stage("lost", 3))
+
+    for _ in range(50):
+        assert pipeline.stage("new") is not None
+        copied = pipeline.model_copy(update={"stages": (lost,)})
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            found = list(executor.map(copied.stage, ["lost"] * 16))
+        assert found == [lost] * 16
+
+
+def _line_item(
+    quantity: int, unit_price: int, discount_percent: int = 0, tax_percent: int = 0
+) -> DealLineItem:
+    return DealLineItem(
+        id=f"li-{quantity}-{unit_price}",
+        product_name="Batik",
+        quantity=quantity,
+        unit_price=unit_price,
+        discount_percent=discount_percent,
+        tax_percent=tax_percent,
+        total_amount=0,
+    )
+
+
+def _deal(*line_items: DealLineItem) -> Deal:
+    return Deal(
+        id="d-1",
+        tenant_id="tenant-1",
+        opportunity_id="o-1",
+        customer_id="c-1",
+        name="Order",
+        value=Money(amount=123, currency="USD"),
+        line_items=list(line_items),
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+# Expected totals are what the server's DealLineItem.Calculate returns for
+# the same inputs.
+@pytest.mark.parametrize(
+    "quantity, unit_price, discount_percent, tax_percent, expected",
+    [
+        (3, 999, 15, 6, 2700),
+        (3, -999, 15, 6, -2700),
+        (1, 10, 15, 0, 8),  # 1.5 cent discount rounds to 2
+        (1, -10, 15, 0, -8),  # -1.5 cent discount rounds to -2
+        (1, 50, 0, 1, 51),  # 0.5 cent tax rounds to 1
+        (7, 1234, 33, 8, 6250),
+        (2, 1999, 0, 0, 3998),
+    ],
+)
+def test_line_item_total_matches_server_rounding(
+    quantity, unit_price, discount_percent, tax_percent, expected
+):
+    item = _line_item(quantity, unit_price, discount_percent, tax_percent)
+
+    assert item.compute_total() == expected
+
+
+def test_recompute_totals_returns_updated_copy():
+    deal = _deal(_line_item(3, 999, 15, 6), _line_item(2, 1999))
+
+    updated = deal.recompute_totals()
+
+    assert [item.total_amount for item in updated.line_items] == [2700, 3998]
+    assert updated.value == Money(amount=6698, currency="USD")
+    assert [item.total_amount for item in deal.line_items] == [0, 0]
+    assert deal.value.amount == 123
+
+
+def test_recompute_totals_without_line_items_keeps_value():
+    deal = _deal()
+
+    assert deal.recompute_totals().value == Money(amount=123, currency="USD")
+
+
+@pytest.mark.parametrize(
+    "amount, expected",
+    [(12345, "123.45"), (-505, "-5.05"), (500, "5.00"), (0, "0.00")],
+)
+def test_decimal_amount_is_exact(amount, expected):
+    decimal_amount = Money(amount=amount).decimal_amount
+
+    assert isinstance(decimal_amount, Decimal)
+    assert decimal_amount == Decimal(expected)
+    assert str(decimal_amount) == expected
+
+
+def test_sum_adds_amounts_in_one_currency():
+    total = Money.sum([Money(amount=150, currency="USD"), Money(amount=-50, currency="USD")])
+
+    assert total == Money(amount=100, currency="USD")
+
+
+def test_sum_of_nothing_is_zero():
+    assert Money.sum([]) == Money(amount=0, currency="MYR")
+    assert Money.sum([], currency="USD") == Money(amount=0, currency="USD")
+
+
+def test_sum_rejects_mixed_currencies():
+    with pytest.raises(ValueError):
+        Money.sum([Money(amount=1), Money(amount=2, currency="USD")])
+
+    with pytest.raises(ValueError):
+        Money.sum([Money(amount=1)], currency="USD")
@@ -0,0 +1,53 @@
+"""Tests for iterating over every page of a list endpoint."""
+
+from typing import List
+
+import httpx
+
+from conftest import customer_json
+
+TOTAL_PAGES = 3
+PER_PAGE = 2
+
+
+def _page(request: httpx.Request) -> httpx.Response:
+    """Serve full pages of customers for page 1..TOTAL_PAGES."""
+    page = int(request.url.params["page"])
+    data = [customer_json(f"{page}-{i}") for i in range(PER_PAGE)]
+    return httpx.Response(
+        200,
+        json={"data": data, "total": TOTAL_PAGES * PER_PAGE, "total_pages": TOTAL_PAGES},
+    )
+
+
+EXPECTED_IDS = [f"{page}-{i}" for page in range(1, TOTAL_PAGES + 1) for i in range(PER_PAGE)]
+
+
+def test_iter_all_stops_at_total_pages(make_client):
+    pages: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        pages.append(request.url.params["page"])
+        return _page(request)
+
+    client = make_client(handler)
+
+    customers = list(client.customers.iter_all(per_page=PER_PAGE))
+
+    assert [c.id for c in customers] == EXPECTED_IDS
+    assert pages == ["1", "2", "3"]
+
+
+async def test_async_iter_all_stops_at_total_pages(make_async_client):
+    pages: List[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        pages.append(request.url.params["page"])
+        return _page(request)
+
+    client = make_async_client(handler)
+
+    customers = [c async for c in client.customers.iter_all(per_page=PER_PAGE)]
+
+    assert [c.id for c in customers] == EXPECTED_IDS
+    assert pages == ["1", "2", "3"]
@@ -0,0 +1,99 @@
+"""Tests for retrying rate-limited and unavailable responses."""
+
+from typing import List
+
+import httpx
+import pytest
+
+from crm_sdk import RateLimitError, ServerError
+
+
+def test_rate_limited_request_is_retried_until_it_succeeds(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(429, json={"error": "slow down"})
+        return httpx.Response(200, json={"ok": True})
+
+    client = make_client(handler, retries=3, backoff_base=0)
+
+    assert client.get("/api/v1/ping") == {"ok": True}
+    assert len(calls) == 3
+
+
+def test_rate_limit_error_is_raised_once_retries_run_out(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(429, json={"error": "slow down", "retry_after": 0})
+
+    client = make_client(handler, retries=2, backoff_base=0)
+
+    with pytest.raises(RateLimitError) as exc_info:
+        client.get("/api/v1/ping")
+
+    assert exc_info.value.retry_after == 0
+    assert len(calls) == 3
+
+
+def test_unavailable_post_is_not_retried(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503, json={"error": "down"})
+
+    client = make_client(handler, retries=3, backoff_base=0)
+
+    with pytest.raises(ServerError):
+        client.post("/api/v1/customers", json={"name": "Acme"})
+
+    assert len(calls) == 1
+
+
+def test_unavailable_get_is_retried(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503, json={"error": "down"})
+
+    client = make_client(handler, retries=2, backoff_base=0)
+
+    with pytest.raises(ServerError):
+        client.get("/api/v1/customers")
+
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    "timeout", [None, httpx.Timeout(5.0), httpx.Timeout(None, connect=5.0)]
+)
+def test_requests_work_with_disabled_or_structured_timeout(make_client, timeout):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) < 2:
+            return httpx.Response(429, json={"error": "slow down"})
+        return httpx.Response(200, json={"ok": True})
+
+    client = make_client(handler, timeout=timeout, retries=3, backoff_base=0)
+
+    assert client.get("/api/v1/ping") == {"ok": True}
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("timeout", [None, httpx.Timeout(5.0)])
+async def test_async_requests_work_with_disabled_or_structured_timeout(
+    make_async_client, timeout
+):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True})
+
+    client = make_async_client(handler, timeout=timeout)
+
+    assert await client.get("/api/v1/ping") == {"ok": True}
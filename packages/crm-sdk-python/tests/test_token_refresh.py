@@ -0,0 +1,90 @@
+"""Tests for access token refresh."""
+
+import asyncio
+import base64
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import httpx
+
+from conftest import customer_json, login_json
+
+
+def _jwt(exp: float) -> str:
+    """Unsigned JWT carrying only an ``exp`` claim."""
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode()
+    return f"header.{payload.rstrip('=')}.signature"
+
+
+def test_concurrent_requests_share_one_refresh(make_client):
+    refreshes: List[httpx.Request] = []
+    authorizations: List[str] = []
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/api/v1/auth/login":
+            # Already inside the refresh margin, so the next request refreshes.
+            return httpx.Response(200, json=login_json(expires_in=0))
+        if path == "/api/v1/auth/refresh":
+            with lock:
+                refreshes.append(request)
+            time.sleep(0.05)
+            return httpx.Response(200, json={"access_token": "A2", "expires_in": 3600})
+        with lock:
+            authorizations.append(request.headers["Authorization"])
+        return httpx.Response(200, json=customer_json(path.rsplit("/", 1)[1]))
+
+    client = make_client(handler)
+    client.auth.login("user@example.com", "password")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(client.customers.get, [str(i) for i in range(16)]))
+
+    assert len(refreshes) == 1
+    assert authorizations == ["Bearer A2"] * 16
+
+
+async def test_concurrent_async_requests_share_one_refresh(make_async_client):
+    refreshes: List[httpx.Request] = []
+    authorizations: List[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/api/v1/auth/login":
+            return httpx.Response(200, json=login_json(expires_in=0))
+        if path == "/api/v1/auth/refresh":
+            refreshes.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"access_token": "A2", "expires_in": 3600})
+        authorizations.append(request.headers["Authorization"])
+        return httpx.Response(200, json=customer_json(path.rsplit("/", 1)[1]))
+
+    client = make_async_client(handler)
+    await client.auth.login("user@example.com", "password")
+
+    await asyncio.gather(*(client.customers.get(str(i)) for i in range(16)))
+
+    assert len(refreshes) == 1
+    assert authorizations == ["Bearer A2"] * 16
+
+
+def test_expires_in_is_preferred_over_skewed_jwt_exp(make_client):
+    client = make_client(lambda request: httpx.Response(200, json={}))
+
+    # The client clock runs 11 minutes ahead of the server that issued a
+    # 15 minute token, so exp - time.time() is below the refresh margin.
+    client._set_tokens(_jwt(time.time() - 660 + 900), "R", 900)
+
+    assert not client._should_refresh_token()
+
+
+def test_jwt_exp_is_used_without_expires_in(make_client):
+    client = make_client(lambda request: httpx.Response(200, json={}))
+
+    client._set_tokens(_jwt(time.time() + 60), "R", None)
+
+    assert client._should_refresh_token()